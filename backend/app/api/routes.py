@@ -1,15 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from ..application.dto.metrics import LogisticsMetricsDTO
+from ..application.dto.metrics import LogisticsMetricsDocDTO
 from ..application.services.metrics_service import MetricsService
 
 
 def create_metrics_router(service: MetricsService) -> APIRouter:
     router = APIRouter(prefix="/api", tags=["metrics"])
 
-    @router.get("/metrics", response_model=LogisticsMetricsDTO)
-    async def get_metrics() -> LogisticsMetricsDTO:
-        metrics = await service.get_current_metrics()
-        return LogisticsMetricsDTO.from_domain(metrics)
+    @router.get("/metrics", response_model=LogisticsMetricsDocDTO)
+    async def get_metrics() -> Response:
+        return Response(content=await service.get_cached_json(), media_type="application/json")
 
     return router
@@ -1,12 +1,51 @@
-from dataclasses import asdict
+import struct
 from datetime import datetime
+from typing import Callable, Union
+
+import msgspec
+import numpy as np
 from pydantic import BaseModel, Field
 
-from ...domain.models import LogisticsMetrics
+from ...domain.models import KPI_SCALE, LogisticsMetrics
+
+_ENCODER = msgspec.json.Encoder()
+
+# Serialize a domain snapshot straight to JSON bytes for the wire.
+encode_metrics: Callable[[LogisticsMetrics], bytes] = _ENCODER.encode
+
+# Binary WebSocket frame: the 13 KPIs as little-endian int16 fixed-point
+# values (scaled by KPI_SCALE) in LogisticsMetrics field order, followed by
+# the snapshot time as a little-endian float64 of epoch milliseconds (34 bytes
+# in total). The scale is mirrored in the frontend decoder.
+_FRAME_SCALE = np.array(KPI_SCALE, dtype=np.float64)
+_FRAME_TIMESTAMP = struct.Struct("<d")
+
+# KPI vector in KPI_SCALE fixed-point steps, as carried by the frame.
+KpiSteps = np.ndarray
+
+
+def quantize_kpis(values: np.ndarray) -> KpiSteps:
+    """Scale a KPI vector to the int16 fixed-point steps used on the wire."""
+    return np.rint(values * _FRAME_SCALE).astype("<i2")
 
 
-class LogisticsMetricsDTO(BaseModel):
-    """DTO exposed via HTTP/WebSocket responses."""
+def has_moved(steps: KpiSteps, previous: KpiSteps, threshold: Union[int, KpiSteps]) -> bool:
+    """Whether any KPI moved by at least ``threshold`` steps (scalar or per-KPI)."""
+    return bool(np.any(np.abs(steps.astype(np.int32) - previous) >= threshold))
+
+
+def encode_frame(steps: KpiSteps, epoch_ms: int) -> bytes:
+    """Pack quantized KPIs and their timestamp into the binary wire format."""
+    return steps.tobytes() + _FRAME_TIMESTAMP.pack(epoch_ms)
+
+
+class LogisticsMetricsDocDTO(BaseModel):
+    """OpenAPI description of the metrics payload.
+
+    Only used as ``response_model`` for schema generation; responses are
+    encoded from ``LogisticsMetrics`` by ``encode_metrics`` and never pass
+    through this model.
+    """
 
     on_time_delivery_rate: float = Field(..., description="Percentage of deliveries arriving on time")
     avg_delivery_time: float = Field(..., description="Average delivery lead time in hours")
@@ -22,10 +61,3 @@ class LogisticsMetricsDTO(BaseModel):
     hours_driven: float = Field(..., description="Total fleet driving hours (rolling 24h)")
     incident_rate: float = Field(..., description="Incidents per 10k orders")
     timestamp: datetime = Field(..., description="Timestamp for the metrics snapshot")
-
-    class Config:
-        from_attributes = True
-
-    @classmethod
-    def from_domain(cls, metrics: LogisticsMetrics) -> "LogisticsMetricsDTO":
-        return cls(**asdict(metrics))
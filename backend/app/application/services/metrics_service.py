@@ -1,28 +1,81 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List, Optional, Union
 
 from ...domain.models import LogisticsMetrics
 from ...infrastructure.simulation.metrics_simulator import MetricsSimulator
+from ..dto.metrics import KpiSteps, encode_frame, encode_metrics, has_moved, quantize_kpis
 
 
 class MetricsService:
     """Application service orchestrating the simulator and providing snapshots."""
 
-    def __init__(self, simulator: MetricsSimulator, *, update_interval_seconds: float = 3.0) -> None:
+    def __init__(
+        self,
+        simulator: MetricsSimulator,
+        *,
+        update_interval_seconds: float = 3.0,
+        change_threshold: Union[int, KpiSteps] = 1,
+    ) -> None:
         self._simulator = simulator
         self._lock = asyncio.Lock()
         self._current_metrics = simulator.initial_state()
+        self._refresh_encoded()
         self._interval = update_interval_seconds
+        self._change_threshold = change_threshold
+        self._last_broadcast_steps: Optional[KpiSteps] = None
 
     async def get_current_metrics(self) -> LogisticsMetrics:
-        async with self._lock:
-            return self._current_metrics
+        # Snapshots are immutable and swapped in with a single assignment.
+        return self._current_metrics
+
+    async def get_cached_json(self) -> bytes:
+        """Return the current snapshot, encoded once when it was generated."""
+        return self._cached_json
+
+    async def get_cached_frame(self) -> bytes:
+        """Return the current snapshot in the binary WebSocket frame format."""
+        return self._cached_frame
 
     async def generate_next_metrics(self) -> LogisticsMetrics:
         async with self._lock:
-            self._current_metrics = self._simulator.generate_next(self._current_metrics)
+            self._current_metrics = self._simulator.generate_next()
+            self._refresh_encoded()
             return self._current_metrics
 
+    async def generate_metrics_batch(self, count: int) -> List[LogisticsMetrics]:
+        """Advance the simulation by ``count`` ticks, e.g. for backfill or replay.
+
+        The last snapshot of the batch becomes the current one. Always batch
+        through this method rather than on the simulator directly, so the
+        cached snapshot and its encodings stay in sync.
+        """
+        async with self._lock:
+            batch = self._simulator.generate_batch(count)
+            if batch:
+                self._current_metrics = batch[-1]
+                self._refresh_encoded()
+            return batch
+
+    async def next_broadcast_payload(self) -> Optional[bytes]:
+        """Advance one tick and return the binary frame to broadcast.
+
+        Returns ``None`` when no KPI moved by at least ``change_threshold``
+        KPI_SCALE steps (scalar or per-KPI) since the last payload handed out,
+        so listeners simply keep their last-known state.
+        """
+        await self.generate_next_metrics()
+        steps = self._current_steps
+        previous = self._last_broadcast_steps
+        if previous is not None and not has_moved(steps, previous, self._change_threshold):
+            return None
+        self._last_broadcast_steps = steps
+        return self._cached_frame
+
+    def _refresh_encoded(self) -> None:
+        self._cached_json = encode_metrics(self._current_metrics)
+        self._current_steps = quantize_kpis(self._simulator.current_values)
+        self._cached_frame = encode_frame(self._current_steps, self._simulator.current_epoch_ms)
+
     async def stream_metrics(self) -> AsyncGenerator[LogisticsMetrics, None]:
         while True:
             yield await self.generate_next_metrics()
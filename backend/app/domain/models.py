@@ -1,9 +1,7 @@
-from dataclasses import dataclass
-from datetime import datetime
+import msgspec
 
 
-@dataclass(frozen=True)
-class LogisticsMetrics:
+class LogisticsMetrics(msgspec.Struct, frozen=True):
     """Domain entity that captures the primary logistics KPIs."""
 
     on_time_delivery_rate: float
@@ -19,4 +17,10 @@ class LogisticsMetrics:
     operating_ratio: float
     hours_driven: float
     incident_rate: float
-    timestamp: datetime
+    timestamp: str  # ISO-8601 in UTC
+
+
+# Fixed-point scale (10 ** decimals) of each KPI, in LogisticsMetrics field
+# order. Snapshots are rounded to this precision and wire frames carry the
+# scaled integers.
+KPI_SCALE = (10, 10, 10, 10, 10, 100, 10, 10, 10, 100, 10, 10, 100)
@@ -1,128 +1,118 @@
-import math
-import random
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
 
-from ...domain.models import LogisticsMetrics
+import numpy as np
+
+from ...domain.models import KPI_SCALE, LogisticsMetrics
+
+# Per-KPI simulation parameters, laid out in LogisticsMetrics field order:
+# on-time rate, delivery time, perfect orders, orders/hour, accuracy,
+# stockout, pick/pack, utilization, dwell, cost, operating ratio,
+# hours driven, incident rate.
+_INITIAL = np.array([94.2, 31.5, 92.0, 118.0, 97.1, 2.8, 24.0, 76.0, 46.0, 8.7, 86.0, 910.0, 2.1])
+_JITTER = np.array([1.2, 1.5, 1.0, 12.0, 0.8, 0.4, 2.0, 2.5, 3.0, 0.6, 1.5, 25.0, 0.4])
+_WAVE = np.array([0.6, -0.8, 0.0, 5.0, 0.0, -0.2, -0.5, 1.2, 1.0, -0.3, -1.0, 8.0, 0.1])
+_MINIMUM = np.array([85.0, 24.0, 85.0, 70.0, 92.0, 0.5, 15.0, 55.0, 30.0, 6.5, 78.0, 700.0, 0.5])
+_MAXIMUM = np.array([99.0, 48.0, 98.0, 180.0, 99.5, 8.0, 40.0, 95.0, 80.0, 12.0, 95.0, 1100.0, 5.0])
+_DECIMAL_SCALE = np.array(KPI_SCALE, dtype=np.float64)
+
+# Smallest move, in KPI_SCALE steps, worth broadcasting: one tick's jitter
+# amplitude. Drift inside a single tick's noise band is not signal.
+BROADCAST_THRESHOLD_STEPS = np.rint(_JITTER * _DECIMAL_SCALE).astype(np.int64)
+
+# The seasonal wave sin(tick / 6) is read from a precomputed table; the
+# index wraps every 4096 ticks (~3.4 hours at the default cadence).
+_WAVE_TABLE = np.sin(np.arange(4096) / 6.0)
+_WAVE_MASK = _WAVE_TABLE.size - 1
+
+# Each simulated tick advances the snapshot clock by five minutes.
+_TICK_MS = 300_000
+
+
+def _format_timestamp(epoch_ms: int) -> str:
+    return datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    return np.round(values * _DECIMAL_SCALE) / _DECIMAL_SCALE
+
+
+def _snapshot(values: List[float], epoch_ms: int) -> LogisticsMetrics:
+    return LogisticsMetrics(*values, timestamp=_format_timestamp(epoch_ms))
 
 
 class MetricsSimulator:
     """Generates realistic looking logistics metrics using stochastic drift."""
 
     def __init__(self, seed: Optional[int] = None) -> None:
-        self._random = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
         self._tick = 0
+        self._values = _INITIAL.copy()
+        self._current = _INITIAL.copy()
+        self._epoch_ms = time.time_ns() // 1_000_000
+
+    @property
+    def current_values(self) -> np.ndarray:
+        """Rounded KPIs of the latest snapshot, in LogisticsMetrics field order."""
+        return self._current
+
+    @property
+    def current_epoch_ms(self) -> int:
+        """Timestamp of the latest snapshot in epoch milliseconds."""
+        return self._epoch_ms
 
     def initial_state(self) -> LogisticsMetrics:
-        return LogisticsMetrics(
-            on_time_delivery_rate=94.2,
-            avg_delivery_time=31.5,
-            perfect_order_rate=92.0,
-            orders_per_hour=118.0,
-            order_accuracy=97.1,
-            stockout_rate=2.8,
-            pick_pack_cycle_time=24.0,
-            truck_utilization=76.0,
-            avg_dwell_time=46.0,
-            cost_per_order=8.7,
-            operating_ratio=86.0,
-            hours_driven=910.0,
-            incident_rate=2.1,
-            timestamp=datetime.utcnow(),
-        )
-
-    def generate_next(self, previous: LogisticsMetrics) -> LogisticsMetrics:
+        """Reset the simulation to its starting KPIs, wave phase and clock.
+
+        Returns the starting snapshot, stamped with the current time.
+        """
+        self._tick = 0
+        self._values = _INITIAL.copy()
+        self._current = _INITIAL.copy()
+        self._epoch_ms = time.time_ns() // 1_000_000
+        return _snapshot(self._current.tolist(), self._epoch_ms)
+
+    def generate_next(self) -> LogisticsMetrics:
         self._tick += 1
 
-        def bounded(value: float, *, minimum: float, maximum: float) -> float:
-            return max(min(value, maximum), minimum)
-
-        def jitter(amount: float) -> float:
-            return self._random.uniform(-amount, amount)
-
-        wave = math.sin(self._tick / 6)
-
-        on_time = bounded(
-            previous.on_time_delivery_rate + jitter(1.2) + wave * 0.6,
-            minimum=85.0,
-            maximum=99.0,
-        )
-        avg_time = bounded(
-            previous.avg_delivery_time + jitter(1.5) - wave * 0.8,
-            minimum=24.0,
-            maximum=48.0,
-        )
-        perfect_order = bounded(
-            previous.perfect_order_rate + jitter(1.0),
-            minimum=85.0,
-            maximum=98.0,
-        )
-        orders_hour = bounded(
-            previous.orders_per_hour + jitter(12.0) + wave * 5,
-            minimum=70.0,
-            maximum=180.0,
-        )
-        accuracy = bounded(
-            previous.order_accuracy + jitter(0.8),
-            minimum=92.0,
-            maximum=99.5,
-        )
-        stockout = bounded(
-            previous.stockout_rate + jitter(0.4) - wave * 0.2,
-            minimum=0.5,
-            maximum=8.0,
-        )
-        pick_pack = bounded(
-            previous.pick_pack_cycle_time + jitter(2.0) - wave * 0.5,
-            minimum=15.0,
-            maximum=40.0,
-        )
-        utilization = bounded(
-            previous.truck_utilization + jitter(2.5) + wave * 1.2,
-            minimum=55.0,
-            maximum=95.0,
-        )
-        dwell = bounded(
-            previous.avg_dwell_time + jitter(3.0) + wave,
-            minimum=30.0,
-            maximum=80.0,
-        )
-        cost = bounded(
-            previous.cost_per_order + jitter(0.6) - wave * 0.3,
-            minimum=6.5,
-            maximum=12.0,
-        )
-        operating_ratio = bounded(
-            previous.operating_ratio + jitter(1.5) - wave,
-            minimum=78.0,
-            maximum=95.0,
-        )
-        hours_driven = bounded(
-            previous.hours_driven + jitter(25.0) + wave * 8,
-            minimum=700.0,
-            maximum=1100.0,
-        )
-        incident_rate = bounded(
-            previous.incident_rate + jitter(0.4) + wave * 0.1,
-            minimum=0.5,
-            maximum=5.0,
-        )
-
-        timestamp = previous.timestamp + timedelta(minutes=5)
-
-        return LogisticsMetrics(
-            on_time_delivery_rate=round(on_time, 1),
-            avg_delivery_time=round(avg_time, 1),
-            perfect_order_rate=round(perfect_order, 1),
-            orders_per_hour=round(orders_hour, 1),
-            order_accuracy=round(accuracy, 1),
-            stockout_rate=round(stockout, 2),
-            pick_pack_cycle_time=round(pick_pack, 1),
-            truck_utilization=round(utilization, 1),
-            avg_dwell_time=round(dwell, 1),
-            cost_per_order=round(cost, 2),
-            operating_ratio=round(operating_ratio, 1),
-            hours_driven=round(hours_driven, 1),
-            incident_rate=round(incident_rate, 2),
-            timestamp=timestamp,
-        )
+        wave = _WAVE_TABLE[self._tick & _WAVE_MASK]
+        noise = self._rng.uniform(-1.0, 1.0, _JITTER.size) * _JITTER
+        self._values = np.clip(self._values + noise + wave * _WAVE, _MINIMUM, _MAXIMUM)
+        self._epoch_ms += _TICK_MS
+
+        self._current = _round(self._values)
+        return _snapshot(self._current.tolist(), self._epoch_ms)
+
+    def generate_batch(self, count: int) -> List[LogisticsMetrics]:
+        """Advance the simulation by ``count`` ticks, e.g. for backfill or replay.
+
+        Noise and wave terms for every tick are drawn in one vectorized pass;
+        only the stateful clamp runs per row. The simulator ends up in the
+        same state as after ``count`` calls to ``generate_next``.
+        """
+        if count <= 0:
+            return []
+
+        ticks = np.arange(self._tick + 1, self._tick + 1 + count)
+        waves = _WAVE_TABLE[ticks & _WAVE_MASK]
+        noise = self._rng.uniform(-1.0, 1.0, (count, _JITTER.size)) * _JITTER
+        steps = noise + waves[:, None] * _WAVE
+
+        rows = np.empty_like(steps)
+        values = self._values
+        for index in range(count):
+            values = np.clip(values + steps[index], _MINIMUM, _MAXIMUM)
+            rows[index] = values
+
+        rounded = _round(rows)
+        start_ms = self._epoch_ms
+        self._values = values
+        self._current = rounded[-1]
+        self._tick += count
+        self._epoch_ms += count * _TICK_MS
+
+        return [
+            _snapshot(row, start_ms + (index + 1) * _TICK_MS)
+            for index, row in enumerate(rounded.tolist())
+        ]
@@ -1,6 +1,6 @@
 import asyncio
 import contextlib
-from typing import Awaitable, Callable, List, Optional
+from typing import Awaitable, Callable, List, Optional, Set
 
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -9,8 +9,8 @@ class ConnectionManager:
     """Keeps track of active websocket connections and handles broadcasts."""
 
     def __init__(self) -> None:
-        self._connections: List[WebSocket] = []
-        self._lock = asyncio.Lock()
+        # Only touched from the event loop, so plain set operations are atomic.
+        self._connections: Set[WebSocket] = set()
 
     @property
     def connection_count(self) -> int:
@@ -18,26 +18,30 @@ class ConnectionManager:
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        async with self._lock:
-            self._connections.append(websocket)
+        self._connections.add(websocket)
 
-    async def disconnect(self, websocket: WebSocket) -> None:
-        async with self._lock:
-            if websocket in self._connections:
-                self._connections.remove(websocket)
+    def disconnect(self, websocket: WebSocket) -> None:
+        self._connections.discard(websocket)
 
-    async def send_personal_message(self, message: dict, websocket: WebSocket) -> None:
-        await websocket.send_json(message)
+    async def send_personal_message(self, payload: bytes, websocket: WebSocket) -> None:
+        await websocket.send_bytes(payload)
 
-    async def broadcast(self, message: dict) -> None:
+    async def broadcast(self, payload: bytes) -> None:
         stale: List[WebSocket] = []
-        for connection in list(self._connections):
+
+        async def send(connection: WebSocket) -> None:
+            # Handled per task: a TaskGroup cancels every sibling on the first
+            # unhandled error, and one dead client must not starve the rest.
             try:
-                await connection.send_json(message)
+                await connection.send_bytes(payload)
             except (WebSocketDisconnect, RuntimeError):
                 stale.append(connection)
+
+        async with asyncio.TaskGroup() as group:
+            for connection in tuple(self._connections):
+                group.create_task(send(connection))
         for connection in stale:
-            await self.disconnect(connection)
+            self.disconnect(connection)
 
 
 class MetricsBroadcaster:
@@ -46,33 +50,33 @@ class MetricsBroadcaster:
     def __init__(
         self,
         manager: ConnectionManager,
-        update_coro: Callable[[], Awaitable[dict]],
+        update_coro: Callable[[], Awaitable[Optional[bytes]]],
         interval: float,
     ) -> None:
         self._manager = manager
         self._update_coro = update_coro
         self._interval = interval
         self._task: Optional[asyncio.Task] = None
-        self._lock = asyncio.Lock()
 
     async def start(self) -> None:
-        async with self._lock:
-            if self._task is None or self._task.done():
-                self._task = asyncio.create_task(self._run())
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
 
     async def stop(self) -> None:
-        async with self._lock:
-            if self._task is not None:
-                self._task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await self._task
-                self._task = None
+        # Detach the task before awaiting it so a concurrent start() spawns a
+        # fresh one instead of seeing the task that is being torn down.
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
 
     async def _run(self) -> None:
         try:
             while True:
                 payload = await self._update_coro()
-                await self._manager.broadcast(payload)
+                if payload is not None:
+                    await self._manager.broadcast(payload)
                 await asyncio.sleep(self._interval)
         except asyncio.CancelledError:
             return
@@ -1,10 +1,12 @@
+from typing import Optional
+
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .api.routes import create_metrics_router
-from .application.dto.metrics import LogisticsMetricsDTO
 from .application.services.metrics_service import MetricsService
-from .infrastructure.simulation.metrics_simulator import MetricsSimulator
+from .infrastructure.simulation.metrics_simulator import BROADCAST_THRESHOLD_STEPS, MetricsSimulator
 from .infrastructure.websocket.manager import ConnectionManager, MetricsBroadcaster
 
 app = FastAPI(title="Cross-Team Logistics Dashboard MVP")
@@ -17,15 +19,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=200)
 
 simulator = MetricsSimulator()
-metrics_service = MetricsService(simulator)
+metrics_service = MetricsService(simulator, change_threshold=BROADCAST_THRESHOLD_STEPS)
 connection_manager = ConnectionManager()
 
 
-async def _generate_update_payload() -> dict:
-    metrics = await metrics_service.generate_next_metrics()
-    return LogisticsMetricsDTO.from_domain(metrics).model_dump(mode="json")
+async def _generate_update_payload() -> Optional[bytes]:
+    return await metrics_service.next_broadcast_payload()
 
 
 broadcaster = MetricsBroadcaster(
@@ -41,18 +43,15 @@ app.include_router(create_metrics_router(metrics_service))
 async def metrics_ws(websocket: WebSocket) -> None:
     await connection_manager.connect(websocket)
     try:
-        current = await metrics_service.get_current_metrics()
-        await connection_manager.send_personal_message(
-            LogisticsMetricsDTO.from_domain(current).model_dump(mode="json"),
-            websocket,
-        )
+        current = await metrics_service.get_cached_frame()
+        await connection_manager.send_personal_message(current, websocket)
 
         await broadcaster.start()
 
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
-        await connection_manager.disconnect(websocket)
+        connection_manager.disconnect(websocket)
     finally:
         if connection_manager.connection_count == 0:
             await broadcaster.stop()
@@ -0,0 +1,61 @@
+import struct
+
+import numpy as np
+
+from app.application.dto.metrics import encode_frame, has_moved, quantize_kpis
+from app.domain.models import KPI_SCALE
+from app.infrastructure.simulation.metrics_simulator import _MAXIMUM, _MINIMUM
+
+BASE = np.array([94.2, 31.5, 92.0, 118.0, 97.1, 2.8, 24.0, 76.0, 46.0, 8.7, 86.0, 910.0, 2.1])
+
+
+def test_quantize_kpis_counts_one_display_step_as_one() -> None:
+    moved = BASE.copy()
+    moved[0] = 94.3  # on_time_delivery_rate, one decimal
+    moved[5] = 2.81  # stockout_rate, two decimals
+
+    delta = quantize_kpis(moved).astype(np.int32) - quantize_kpis(BASE)
+
+    assert delta.tolist() == [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]
+
+
+def test_has_moved_applies_the_threshold_in_whole_steps() -> None:
+    one_step = BASE.copy()
+    one_step[0] = 94.3
+    one_step[5] = 2.81
+    two_steps = one_step.copy()
+    two_steps[5] = 2.82
+
+    previous = quantize_kpis(BASE)
+
+    assert not has_moved(quantize_kpis(BASE), previous, 1)
+    assert has_moved(quantize_kpis(one_step), previous, 1)
+    assert not has_moved(quantize_kpis(one_step), previous, 2)
+    assert has_moved(quantize_kpis(two_steps), previous, 2)
+
+
+def test_has_moved_accepts_per_kpi_thresholds() -> None:
+    moved = BASE.copy()
+    moved[3] = 119.0  # orders_per_hour, ten steps
+
+    thresholds = np.full(13, 11)
+    assert not has_moved(quantize_kpis(moved), quantize_kpis(BASE), thresholds)
+
+    thresholds[3] = 10
+    assert has_moved(quantize_kpis(moved), quantize_kpis(BASE), thresholds)
+
+
+def test_encode_frame_layout() -> None:
+    frame = encode_frame(quantize_kpis(BASE), 1_700_000_000_123)
+
+    assert len(frame) == 34
+    *kpis, epoch_ms = struct.unpack("<13hd", frame)
+    assert kpis == [942, 315, 920, 1180, 971, 280, 240, 760, 460, 870, 860, 9100, 210]
+    assert epoch_ms == 1_700_000_000_123
+
+
+def test_simulator_bounds_fit_the_int16_frame() -> None:
+    # astype(int16) wraps silently, so every clamp bound must round-trip.
+    for bound in (_MINIMUM, _MAXIMUM):
+        *kpis, _ = struct.unpack("<13hd", encode_frame(quantize_kpis(bound), 0))
+        assert kpis == np.rint(bound * np.array(KPI_SCALE)).tolist()
@@ -0,0 +1,29 @@
+import asyncio
+
+from app.application.dto.metrics import encode_metrics
+from app.application.services.metrics_service import MetricsService
+from app.infrastructure.simulation.metrics_simulator import BROADCAST_THRESHOLD_STEPS, MetricsSimulator
+
+
+def test_generate_metrics_batch_refreshes_current_snapshot() -> None:
+    async def scenario() -> None:
+        service = MetricsService(MetricsSimulator(11))
+
+        batch = await service.generate_metrics_batch(25)
+
+        assert len(batch) == 25
+        assert await service.get_current_metrics() == batch[-1]
+        assert await service.get_cached_json() == encode_metrics(batch[-1])
+
+    asyncio.run(scenario())
+
+
+def test_next_broadcast_payload_skips_ticks_below_threshold() -> None:
+    async def scenario() -> list:
+        service = MetricsService(MetricsSimulator(0), change_threshold=BROADCAST_THRESHOLD_STEPS)
+        return [await service.next_broadcast_payload() for _ in range(40)]
+
+    payloads = asyncio.run(scenario())
+
+    skipped = [tick for tick, payload in enumerate(payloads) if payload is None]
+    assert skipped == [1, 11, 14, 16, 18, 20, 33, 36]
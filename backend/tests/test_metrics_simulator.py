@@ -0,0 +1,27 @@
+from app.infrastructure.simulation.metrics_simulator import MetricsSimulator
+
+
+def _seeded(seed: int) -> MetricsSimulator:
+    simulator = MetricsSimulator(seed)
+    simulator.initial_state()
+    # Pin the clock so both simulators stamp identical timestamps.
+    simulator._epoch_ms = 1_700_000_000_000
+    return simulator
+
+
+def test_generate_batch_matches_repeated_generate_next() -> None:
+    stepwise = _seeded(7)
+    batched = _seeded(7)
+
+    expected = [stepwise.generate_next() for _ in range(5000)]
+
+    assert batched.generate_batch(5000) == expected
+    assert batched.generate_next() == stepwise.generate_next()
+
+
+def test_generate_batch_with_no_ticks_leaves_state_untouched() -> None:
+    stepwise = _seeded(3)
+    batched = _seeded(3)
+
+    assert batched.generate_batch(0) == []
+    assert batched.generate_next() == stepwise.generate_next()
@@ -67,6 +67,37 @@ const WS_BASE = (process.env.NEXT_PUBLIC_WS_BASE_URL ?? HTTP_BASE.replace(/^http
 const METRICS_ENDPOINT = `${HTTP_BASE}/api/metrics`;
 const WS_ENDPOINT = `${WS_BASE}/ws/metrics`;
 
+// Binary WebSocket frames carry each KPI as a little-endian int16 scaled by
+// FRAME_SCALE (in this order), followed by a float64 epoch-ms timestamp.
+const FRAME_FIELDS: Exclude<keyof Metrics, "timestamp">[] = [
+  "on_time_delivery_rate",
+  "avg_delivery_time",
+  "perfect_order_rate",
+  "orders_per_hour",
+  "order_accuracy",
+  "stockout_rate",
+  "pick_pack_cycle_time",
+  "truck_utilization",
+  "avg_dwell_time",
+  "cost_per_order",
+  "operating_ratio",
+  "hours_driven",
+  "incident_rate",
+];
+const FRAME_SCALE = [10, 10, 10, 10, 10, 100, 10, 10, 10, 100, 10, 10, 100];
+const FRAME_TIMESTAMP_OFFSET = FRAME_FIELDS.length * 2;
+
+const decodeFrame = (buffer: ArrayBuffer): Metrics => {
+  const view = new DataView(buffer);
+  const snapshot = {
+    timestamp: new Date(view.getFloat64(FRAME_TIMESTAMP_OFFSET, true)).toISOString(),
+  } as Metrics;
+  FRAME_FIELDS.forEach((key, index) => {
+    snapshot[key] = view.getInt16(index * 2, true) / FRAME_SCALE[index];
+  });
+  return snapshot;
+};
+
 const cardConfigs: CardConfig[] = [
   {
     key: "on_time_delivery_rate",
@@ -246,6 +277,7 @@ export default function Dashboard() {
     const connect = () => {
       setConnectionStatus("connecting");
       socket = new WebSocket(WS_ENDPOINT);
+      socket.binaryType = "arraybuffer";
 
       socket.onopen = () => {
         if (!isMounted) {
@@ -256,7 +288,8 @@ export default function Dashboard() {
 
       socket.onmessage = (event) => {
         try {
-          const payload = JSON.parse(event.data) as Metrics;
+          const payload =
+            typeof event.data === "string" ? (JSON.parse(event.data) as Metrics) : decodeFrame(event.data);
           ingestMetrics(payload);
         } catch (err) {
           console.error("Unable to parse metrics payload", err);
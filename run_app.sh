@@ -63,7 +63,8 @@ fi
 echo "Starting backend (FastAPI) on port $BACKEND_PORT..."
 (
   cd "$ROOT_DIR/backend"
-  "$UVICORN_CMD" app.main:app --reload --host 0.0.0.0 --port "$BACKEND_PORT"
+  "$UVICORN_CMD" app.main:app --reload --host 0.0.0.0 --port "$BACKEND_PORT" \
+    --ws websockets --ws-per-message-deflate true
 ) &
 BACKEND_PID=$!
 